@@ -16,10 +16,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
+from math import isclose
 from typing import Tuple
 
-from pytest import approx
-
 
 @dataclass
 class RecordHeading:
@@ -88,7 +87,9 @@ class RecordHeadingMatch:
         if not isinstance(other, RecordHeadingMatch):
             return False
         # Compare similarity_indice with tolerance (because it is a double)
-        return self.record_heading == other.record_heading and self.similarity_indice == approx(other.similarity_indice)
+        return self.record_heading == other.record_heading and isclose(
+            self.similarity_indice, other.similarity_indice, rel_tol=1e-6, abs_tol=1e-12
+        )
 
 
 @dataclass
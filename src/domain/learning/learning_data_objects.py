@@ -19,7 +19,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class ReviewGroup:
     """
     A review group references a set of records destined to be reviewed together for a given topic.
@@ -77,16 +77,15 @@ class LearningProvider(LearningProviderPort):
         global_record_position = (
             self.current_review_group.group_index * MAX_RECORDS_PER_REVIEW_GROUP + self._current_reviewed_record_position
         )
-        if (
-            self._current_reviewed_record_position < self.get_number_of_records_in_review_group() - 1
-            and self._current_reviewed_record_position < MAX_RECORDS_PER_REVIEW_GROUP - 1
-        ):
-            self._current_reviewed_record_position += 1
-        else:
-            self._current_reviewed_record_position = 0
-            self._update_review_group_dates_and_count()
+        self._advance_reviewed_record_position(self.get_number_of_records_in_review_group())
         return self._knowledge_persistence.get_record_by_index(self.current_review_group.topic, global_record_position)
 
+    def advance_review_session(self, count: int) -> None:
+        # The number of records in the group does not change during the session: get it once
+        records_in_review_group = self.get_number_of_records_in_review_group()
+        for _ in range(count):
+            self._advance_reviewed_record_position(records_in_review_group)
+
     def fetch_groups_to_review(self) -> Tuple[ReviewGroup, ...]:
         for topic in self._knowledge_persistence.get_topic_list():
             self.__update_review_groups_for_topic(topic)
@@ -112,6 +111,24 @@ class LearningProvider(LearningProviderPort):
         else:
             return MAX_RECORDS_PER_REVIEW_GROUP
 
+    def _advance_reviewed_record_position(self, records_in_review_group: int) -> None:
+        """
+        Moves to the next record of the current review group, or back to the
+        first one once all records have been reviewed, in which case review
+        group dates and count are updated.
+
+        Args:
+            records_in_review_group (int): Number of records in the current review group.
+        """
+        if (
+            self._current_reviewed_record_position < records_in_review_group - 1
+            and self._current_reviewed_record_position < MAX_RECORDS_PER_REVIEW_GROUP - 1
+        ):
+            self._current_reviewed_record_position += 1
+        else:
+            self._current_reviewed_record_position = 0
+            self._update_review_group_dates_and_count()
+
     def __update_review_groups_for_topic(self, topic: str) -> None:
         """
         Update the review groups for a given topic.
@@ -129,26 +146,27 @@ class LearningProvider(LearningProviderPort):
         daysDeltaFrom1to2 = 1
         daysDeltaFrom2to7 = 5
         daysDeltaFrom7to30 = 23
-        today = datetime.today().date()
+        now = datetime.today()
+        today = now.date()
         if self.current_review_group.reviews_count == 0:
-            self.current_review_group.last_review_date = datetime.today()
-            self.current_review_group.next_review_date = datetime.today() + timedelta(days=daysDeltaFrom1to2)
+            self.current_review_group.last_review_date = now
+            self.current_review_group.next_review_date = now + timedelta(days=daysDeltaFrom1to2)
             self.current_review_group.reviews_count += 1
             self._learning_persistence.update_review_group_dates_and_count(self.current_review_group)
         elif self.current_review_group.reviews_count == 1 and self.current_review_group.next_review_date.date() <= today:
-            self.current_review_group.last_review_date = datetime.today()
-            self.current_review_group.next_review_date = datetime.today() + timedelta(days=daysDeltaFrom2to7)
+            self.current_review_group.last_review_date = now
+            self.current_review_group.next_review_date = now + timedelta(days=daysDeltaFrom2to7)
             self.current_review_group.reviews_count += 1
             self._learning_persistence.update_review_group_dates_and_count(self.current_review_group)
 
         elif self.current_review_group.reviews_count == 2 and self.current_review_group.next_review_date.date() <= today:
-            self.current_review_group.last_review_date = datetime.today()
-            self.current_review_group.next_review_date = datetime.today() + timedelta(days=daysDeltaFrom7to30)
+            self.current_review_group.last_review_date = now
+            self.current_review_group.next_review_date = now + timedelta(days=daysDeltaFrom7to30)
             self.current_review_group.reviews_count += 1
             self._learning_persistence.update_review_group_dates_and_count(self.current_review_group)
 
         elif self.current_review_group.reviews_count == 3 and self.current_review_group.next_review_date.date() <= today:
-            self.current_review_group.last_review_date = datetime.today()
+            self.current_review_group.last_review_date = now
             self.current_review_group.next_review_date = None
             self.current_review_group.reviews_count += 1
             self._learning_persistence.update_review_group_dates_and_count(self.current_review_group)
@@ -86,6 +86,18 @@ class LearningProviderPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def advance_review_session(self, count: int) -> None:
+        """
+        Move forward in the current review session by a given number of records,
+        as if get_next_record_to_review() had been called that many times, but
+        without retrieving the records themselves.
+
+        Args:
+            count (int): The number of records to skip.
+        """
+        pass
+
     @abstractmethod
     def fetch_groups_to_review(self) -> Tuple[ReviewGroup, ...]:
         """
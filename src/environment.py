@@ -30,7 +30,8 @@ SOCKET_PATH = Path(CACHE_PATH, "lia.sock")
 SQLITE_FILE = Path(CACHE_PATH, "review_db.sqlite")
 LOG_FILE = Path(CACHE_PATH, "daemon.log")
 MODEL_DL_FILE = Path(CACHE_PATH, ".model_dl")
-MODEL_PATH = Path(Path(__file__).resolve().parent.parent, "paraphrase-multilingual-mpnet-base-v2")
+MODEL_NAME = "paraphrase-multilingual-mpnet-base-v2"
+MODEL_PATH = Path(Path(__file__).resolve().parent.parent, MODEL_NAME)
 
 
 def init_env() -> None:
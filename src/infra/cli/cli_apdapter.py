@@ -73,7 +73,9 @@ def do_list(args: Dict[str, str]) -> None:
         with SQLitePersistenceAdapter(SQLITE_FILE) as learning_persistence:
             learning_provider = LearningProvider(persistence, learning_persistence)
 
-            groups_to_review = learning_provider.fetch_groups_to_review()
+            # Review groups of every topic are updated, commit them all at once
+            with learning_persistence.batch():
+                groups_to_review = learning_provider.fetch_groups_to_review()
 
             for index, group in enumerate(groups_to_review):
                 last_review_date = group.last_review_date.date() if group.last_review_date is not None else None
@@ -132,28 +132,6 @@ def extract_level_1_headings(file_path: Path) -> Tuple[Level1Heading, ...]:
     return tuple(level_1_headings)
 
 
-def extract_level_1_heading_from_line(lineNumber: int, file_path: Path) -> Level1Heading:
-    """
-    Extracts a level 1 heading from a given line number in a file.
-
-    Args:
-        lineNumber (int): The line number where the heading comes from.
-
-    Returns:
-        Level1Heading: An object containing the line index, the extracted heading,
-        and any associated tags.
-    """
-    with open(file_path, "r", encoding="utf-8") as file:
-        for _ in range(lineNumber - 1):
-            next(file)
-        line = file.readline()
-    if not re_level_1_heading.match(line):
-        raise ValueError(f"String {line} does not start with a level 1 heading")
-    tags = _extract_tags(line)
-    heading = re_tag.sub("", line).strip()
-    return Level1Heading(lineNumber, re_level_1_heading.sub("", heading).strip(), tags, ())
-
-
 def extract_section(line_nbr: int, file_path: str) -> str:
     """
     Extract all content from the specified line until the next level 1 heading.
@@ -15,8 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple
+from typing import ClassVar, List, Tuple
 
 from src.domain.knowledge.knowledge_data_objects import KnowledgeRecord, RecordHeading
 from src.domain.knowledge.knowledge_persistence_port import KnowledgePersistencePort
@@ -24,12 +25,13 @@ from src.infra.knowledge.file.file_markdown_parser import (
     Level1Heading,
     extract_commands,
     extract_scripts,
-    extract_level_1_heading_from_line,
     extract_level_1_headings,
     extract_section,
 )
 from src.infra.knowledge.file.file_topic_parser import TopicParser
 
+LEVEL_1_HEADINGS_CACHE_SIZE: int = 64
+
 
 class FilePersistenceAdapter(KnowledgePersistencePort):
     """
@@ -37,9 +39,21 @@ class FilePersistenceAdapter(KnowledgePersistencePort):
     of a file persistence type.
     """
 
+    # Level 1 headings parsed from topic files, shared by all instances and
+    # keyed by file path, modification time and size so that edited files are
+    # parsed again. Least recently used entries are evicted first.
+    _level_1_headings_cache: ClassVar[OrderedDict[Tuple[str, int, int], Tuple[Level1Heading, ...]]] = OrderedDict()
+
     def __init__(self, dataset_dir: Path):
         self.__dataset_dir: Path = dataset_dir
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drops all parsed topic files.
+        """
+        cls._level_1_headings_cache.clear()
+
     def get_topic_list(self) -> Tuple[str, ...]:
         topic_parser = TopicParser(self.__dataset_dir)
         return topic_parser.topics
@@ -55,7 +69,7 @@ class FilePersistenceAdapter(KnowledgePersistencePort):
                     alternative_headings_id=heading.siblings_id,
                 )
             )
-            for heading in extract_level_1_headings(Path(f"{self.__dataset_dir}/{topic}.md"))
+            for heading in self._get_level_1_headings(topic)
         )
 
     def topic_exists(self, topic_name: str) -> bool:
@@ -78,21 +92,39 @@ class FilePersistenceAdapter(KnowledgePersistencePort):
         return extract_commands(record_body)
 
     def count_records_for_topic(self, topic: str) -> int:
-        return len(
-            self._purge_level_1_headings_from_siblings(extract_level_1_headings(Path(f"{self.__dataset_dir}/{topic}.md")))
-        )
+        return len(self._purge_level_1_headings_from_siblings(self._get_level_1_headings(topic)))
 
     def get_record_by_index(self, topic: str, index: int) -> KnowledgeRecord:
-        heading = self._purge_level_1_headings_from_siblings(
-            extract_level_1_headings(Path(f"{self.__dataset_dir}/{topic}.md"))
-        )[index]
+        level_1_headings = self._get_level_1_headings(topic)
+        heading = self._purge_level_1_headings_from_siblings(level_1_headings)[index]
+        # Siblings are level 1 headings too, no need to read them again from the file
+        headings_by_line_number = {heading.line_number: heading for heading in level_1_headings}
         headings_text: Tuple[str, ...] = (heading.text,) + tuple(
-            extract_level_1_heading_from_line(id, Path(f"{self.__dataset_dir}/{topic}.md")).text
-            for id in heading.siblings_id
+            headings_by_line_number[id].text for id in heading.siblings_id
         )
         body = self.get_body(topic, heading.line_number)
         return KnowledgeRecord(id=heading.line_number, headings=headings_text, body=body)
 
+    def _get_level_1_headings(self, topic: str) -> Tuple[Level1Heading, ...]:
+        """
+        Returns the level 1 headings of a topic file, parsing the file only if
+        it is not already cached in its current version.
+        """
+        file_path = Path(f"{self.__dataset_dir}/{topic}.md")
+        file_stat = file_path.stat()
+        key = (str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+        cache = FilePersistenceAdapter._level_1_headings_cache
+
+        level_1_headings = cache.get(key)
+        if level_1_headings is None:
+            level_1_headings = extract_level_1_headings(file_path)
+            cache[key] = level_1_headings
+            if len(cache) > LEVEL_1_HEADINGS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return level_1_headings
+
     @staticmethod
     def _purge_level_1_headings_from_siblings(level_1_headings: Tuple[Level1Heading, ...]) -> Tuple[Level1Heading, ...]:
         purged_headings: List[Level1Heading] = []
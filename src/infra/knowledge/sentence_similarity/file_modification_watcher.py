@@ -0,0 +1,101 @@
+# Lia is a knowledge base organizer providing fast and accurate natural
+# language search from the command line.
+# Copyright (C) 2025  Pierre Giusti
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+from pathlib import Path
+from typing import Optional
+
+IN_MODIFY: int = 0x00000002
+IN_CREATE: int = 0x00000100
+POLLING_INTERVAL: float = 0.1
+
+
+class FileModificationWatcher:
+    """
+    Blocks the calling thread until a file is modified, or until a file is
+    created when watching a directory with the IN_CREATE event.
+
+    On Linux, the kernel inotify API is used (through libc) so that the caller
+    is only woken up when new data has actually been written to the file. On
+    platforms where inotify is not available, it falls back to a short sleep,
+    which preserves the previous polling behavior.
+
+    Waiting also ends as soon as the optional wakeup file descriptor becomes
+    readable, which lets another thread interrupt the wait by writing to it.
+    """
+
+    def __init__(self, path: Path, events: int = IN_MODIFY, wakeup_fd: Optional[int] = None) -> None:
+        """
+        Args:
+            path (Path): The file or directory to watch. It must exist when the watcher is created.
+            events (int): The inotify events to wait for.
+            wakeup_fd (Optional[int]): A file descriptor ending the wait when it becomes readable.
+        """
+        self._inotify_fd: int = -1
+        self._wakeup_fds: list = [wakeup_fd] if wakeup_fd is not None else []
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            inotify_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if inotify_fd >= 0:
+                if libc.inotify_add_watch(inotify_fd, os.fsencode(path), events) >= 0:
+                    self._inotify_fd = inotify_fd
+                else:
+                    os.close(inotify_fd)
+        except (OSError, AttributeError):
+            # No libc or no inotify support (e.g. macOS): use polling
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def wait(self, timeout: float) -> None:
+        """
+        Waits until the watched file is modified, the wakeup file descriptor is
+        readable, or the timeout expires.
+
+        Args:
+            timeout (float): Maximum waiting time in seconds.
+        """
+        if self._inotify_fd < 0:
+            if self._wakeup_fds:
+                select.select(self._wakeup_fds, [], [], min(timeout, POLLING_INTERVAL))
+            else:
+                time.sleep(min(timeout, POLLING_INTERVAL))
+            return
+
+        ready, _, _ = select.select([self._inotify_fd, *self._wakeup_fds], [], [], timeout)
+        if self._inotify_fd in ready:
+            # Drain pending events, their content is not needed
+            try:
+                os.read(self._inotify_fd, 4096)
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        """
+        Releases the inotify file descriptor, if any.
+        """
+        if self._inotify_fd >= 0:
+            os.close(self._inotify_fd)
+            self._inotify_fd = -1
@@ -75,8 +75,8 @@ class BaseSocket:
         try:
             serialized_data = dumps(data)
             data_size = len(serialized_data)
-            self._sock.sendall(data_size.to_bytes(4, "big"))
-            self._sock.sendall(serialized_data)
+            # Size and data are sent together, in a single system call
+            self._sock.sendall(data_size.to_bytes(4, "big") + serialized_data)
         except Exception as e:
             raise RuntimeError(f"Socket - Error while sending : {e}")
 
@@ -84,6 +84,8 @@ class BaseSocket:
         """
         This method reads the size of the incoming data, retrieves the data in
         chunks, deserializes it, and returns the original object.
+        Chunks are received directly into a buffer allocated once for the whole
+        data, so that no intermediate bytes objects are created.
 
         Returns:
             Any: The deserialized data received from the socket.
@@ -96,27 +98,38 @@ class BaseSocket:
             raise ConnectionError("Socket is not connected.")
         try:
             # Get response size
-            data_size_bytes: bytes = self._sock.recv(4)
-            if len(data_size_bytes) != 4:
-                raise RuntimeError("Socket - Failed to receive the data size")
+            data_size_bytes = bytearray(4)
+            self.__receive_into(self._sock, memoryview(data_size_bytes), "Socket - Failed to receive the data size")
             data_size = int.from_bytes(data_size_bytes, "big")
 
-            # Get raw response
-            chunks: list[bytes] = []
-            bytes_received_count = 0
-            while bytes_received_count < data_size:
-                chunk = self._sock.recv(min(4096, data_size - bytes_received_count))
-                if not chunk:
-                    raise RuntimeError("Socket - Socket connection closed unexpectedly")
-                chunks.append(chunk)
-                bytes_received_count += len(chunk)
-            data = b"".join(chunks)
+            # Get raw response, written in place into a single preallocated buffer
+            data = bytearray(data_size)
+            self.__receive_into(self._sock, memoryview(data), "Socket - Socket connection closed unexpectedly")
 
             # Unserialize and return the corresponding object
             return loads(data)
         except Exception as e:
             raise RuntimeError(f"Socket - Failed to receive : {e}")
 
+    def __receive_into(self, sock: socket, buffer: memoryview, error_message: str) -> None:
+        """
+        Fills the given buffer with data received from the socket.
+
+        Args:
+            sock (socket): The connected socket to receive data from.
+            buffer (memoryview): The buffer to fill, its length is the number of bytes to receive.
+            error_message (str): The error message used if the connection is closed before the buffer is full.
+
+        Raises:
+            RuntimeError: If the connection is closed before the buffer is full.
+        """
+        bytes_received_count = 0
+        while bytes_received_count < len(buffer):
+            chunk_size = sock.recv_into(buffer[bytes_received_count:])
+            if not chunk_size:
+                raise RuntimeError(error_message)
+            bytes_received_count += chunk_size
+
     def destroy(self) -> None:
         try:
             if self._sock:
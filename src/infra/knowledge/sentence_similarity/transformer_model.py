@@ -20,6 +20,8 @@ from typing import List, Tuple
 import numpy as np
 from sentence_transformers import SentenceTransformer, util
 
+from src.environment import MODEL_NAME
+
 
 class TransformerModel:
     """
@@ -36,7 +38,7 @@ class TransformerModel:
     """
 
     def __init__(self):
-        self.__model = SentenceTransformer("paraphrase-multilingual-mpnet-base-v2")
+        self.__model = SentenceTransformer(MODEL_NAME)
         # self.__model = SentenceTransformer("/home/pierre/Repitories/lia/paraphrase-multilingual-mpnet-base-v2")
         # self.__model.save("/home/pierre/Repositories/lia/lia/paraphrase-multilingual-mpnet-base-v2")
         # self.__model = SentenceTransformer(str(MODEL_PATH))
@@ -15,14 +15,31 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+import re
+import sys
 import threading
 import time
-from datetime import datetime, timedelta
 from pathlib import Path
 from threading import Thread
 from typing import Optional, Tuple
 
 from src.environment import MODEL_DL_FILE
+from src.infra.knowledge.sentence_similarity.file_modification_watcher import IN_CREATE, FileModificationWatcher
+
+# Maximum time spent waiting for new data before checking timeout and stop conditions
+WAIT_FOR_DATA_TIMEOUT: float = 0.5
+
+# The watcher stops when the log file has not been updated for this many seconds
+NO_UPDATE_TIMEOUT: float = 30.0
+
+# Maximum number of bytes read from the log file at once
+READ_CHUNK_SIZE: int = 65536
+
+# Matches a download progress line, e.g. b"model.safetensors:   2% 21.0M/1.11G [00:03<03:19, 5.47MB/s]"
+LINE_DATA_PATTERN: re.Pattern = re.compile(
+    rb"^\s*(?P<filename>[\w.]+):\s*(?P<percent>\d+)%\s(?P<downloaded>[^/\s]+)/(?P<total>[^/\s]+)(?=\s|$)"
+)
 
 
 class TransformerModelDownloadTracker:
@@ -32,7 +49,8 @@ class TransformerModelDownloadTracker:
     specific model files, based on log entries.
     """
 
-    model_files = {
+    # File names are interned so that status dict keys and set members share the same string objects
+    model_files = frozenset(map(sys.intern, (
         "modules.json",
         "config_sentence_transformers.json",
         "README.md",
@@ -43,11 +61,11 @@ class TransformerModelDownloadTracker:
         "sentencepiece.bpe.model",
         "tokenizer.json",
         "special_tokens_map.json",
-    }
+    )))
 
     # Only these files are tracked in detail during the download process,
     # because not all files provide real-time download progress logs
-    tracked_files = {
+    tracked_files = frozenset(map(sys.intern, (
         "modules.json",
         "config_sentence_transformers.json",
         "sentence_bert_config.json",
@@ -56,7 +74,7 @@ class TransformerModelDownloadTracker:
         "tokenizer_config.json",
         "sentencepiece.bpe.model",
         "special_tokens_map.json",
-    }
+    )))
 
     def __init__(self, model_dl_log_file_path: Path = MODEL_DL_FILE ) -> None:
         """
@@ -64,8 +82,15 @@ class TransformerModelDownloadTracker:
         """
         self.model_dl_file: Path = model_dl_log_file_path
         self.files_dl_status: dict = {}
-        self._dl_watcher_running: bool = False
-        self._timeout_start_time: Optional[datetime] = None
+        # Fully downloaded tracked files. Adding or discarding a file name is idempotent, so
+        # a line processed both by resume() and by the watcher thread is only counted once
+        self._completed_files: set = set()
+        self._tracked_files_count: int = len(self.tracked_files)
+        # Set when the watcher stops, either on request or by itself (timeout or download complete)
+        self._stop_event: threading.Event = threading.Event()
+        self._deadline: Optional[float] = None
+        # Written by stop() so that the watcher thread does not wait for its timeout to notice it
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
         self._thread: Thread = threading.Thread(target=self._monitor, daemon=True)
         self._thread.start()
 
@@ -73,57 +98,74 @@ class TransformerModelDownloadTracker:
         """
         Returns whether the download watcher is currently running.
         """
-        return self._dl_watcher_running
+        return not self._stop_event.is_set()
 
     def resume(self) -> None:
         """
         Resumes the download tracking by parsing the current content of the log file.
         """
-        with open(self.model_dl_file, "r", encoding="utf-8") as f:
+        with open(self.model_dl_file, "rb") as f:
             for line in f:
-                line_data = self._get_line_data(line)
-                self.files_dl_status[line_data[0]] = line_data[1]
+                self._update_file_dl_status(*self._get_line_data(line))
 
     def _monitor(self) -> None:
         """
         Monitors the download log file in real time to update the download status of tracked files.
-        Terminates when a timeout occurs (no update within 10 seconds) or when all tracked files are downloaded.
+        Terminates when a timeout occurs (no update within NO_UPDATE_TIMEOUT seconds) or when all
+        tracked files are downloaded.
+
+        The file is read as raw bytes through its file descriptor: log lines are
+        ASCII, so only the few parsed fields need to be decoded.
         """
-        self._dl_watcher_running = True
-        timeout = timedelta(seconds=30)
+        while not self._stop_event.is_set():
+            try:
+                model_dl_fd = os.open(self.model_dl_file, os.O_RDONLY | os.O_NONBLOCK)
+            except FileNotFoundError:
+                self._wait_for_file_creation()
+                continue
 
-        while self._dl_watcher_running:
             try:
-                with open(self.model_dl_file, "r", encoding="utf-8") as f:
-                    f.seek(0, 2)  # Seek to the end of the file to follow new lines
+                with FileModificationWatcher(self.model_dl_file, wakeup_fd=self._wakeup_read_fd) as file_watcher:
+                    os.lseek(model_dl_fd, 0, os.SEEK_END)  # Seek to the end of the file to follow new lines
+                    pending_line = b""  # Last line read, kept until its end is written
 
-                    while self._dl_watcher_running:
-                        line = f.readline()
+                    while not self._stop_event.is_set():
+                        # Read everything written since last wakeup at once
+                        new_data = os.read(model_dl_fd, READ_CHUNK_SIZE)
 
-                        if line:
-                            line_data = self._get_line_data(line)
-                            self.files_dl_status[line_data[0]] = line_data[1]
-                            self._timeout_start_time = None  # Reset timeout on new data
+                        if new_data:
+                            *lines, pending_line = (pending_line + new_data).split(b"\n")
+                            for line in lines:
+                                self._update_file_dl_status(*self._get_line_data(line))
+                            self._deadline = None  # Reset timeout on new data
 
-                        elif self._timeout_start_time is None:
-                            # No new data; start timeout countdown
-                            self._timeout_start_time = datetime.now()
                         else:
-                            time.sleep(0.1)
+                            if self._deadline is None:
+                                # No new data; start timeout countdown
+                                self._deadline = time.monotonic() + NO_UPDATE_TIMEOUT
+                            # Sleep until new data is written to the file
+                            file_watcher.wait(WAIT_FOR_DATA_TIMEOUT)
 
-                        if self._timeout_start_time is not None:
-                            if (datetime.now() - self._timeout_start_time) > timeout:
-                                # Stop watcher after timeout
-                                self._dl_watcher_running = False
+                        if self._deadline is not None and time.monotonic() > self._deadline:
+                            # Stop watcher after timeout
+                            self._stop_event.set()
 
                         if self.is_download_complete():
-                            self._dl_watcher_running = False
+                            self._stop_event.set()
+            finally:
+                os.close(model_dl_fd)
 
-            except FileNotFoundError:
-                # If the file doesn't exist yet, wait and retry
-                time.sleep(0.5)
+    def _wait_for_file_creation(self) -> None:
+        """
+        Sleeps until a file is created in the directory of the log file, or until
+        WAIT_FOR_DATA_TIMEOUT expires, so that the caller can retry opening the log file.
+        """
+        with FileModificationWatcher(self.model_dl_file.parent, IN_CREATE, self._wakeup_read_fd) as directory_watcher:
+            # The file may have been created before the directory was watched
+            if not self.model_dl_file.exists():
+                directory_watcher.wait(WAIT_FOR_DATA_TIMEOUT)
 
-    def _get_line_data(self, line) -> Tuple[str, dict]:
+    def _get_line_data(self, line: bytes) -> Tuple[str, dict]:
         """
         Parses a line from the download log and extracts the filename and its download status.
 
@@ -131,40 +173,42 @@ class TransformerModelDownloadTracker:
             - modules.json: 100% 229/229 [00:00<00:00, 969kB/s]
             - model.safetensors:   2% 21.0M/1.11G [00:03<03:19, 5.47MB/s]
 
+        Args:
+            line (bytes): A raw (undecoded) line of the log file.
+
         Returns:
             A tuple containing:
                 - filename (str)
                 - a dict with 'percent', 'downloaded', and 'total' keys, or empty values if the line is invalid.
         """
-        if ":" not in line:
-            return ("", {})
-
-        parts = line.split(":", 1)
-        if len(parts) < 2:
+        match = LINE_DATA_PATTERN.match(line)
+        if match is None:
             return ("", {})
 
-        filename = parts[0].strip()
+        filename, percent, downloaded, total = match.groups()
+        filename = sys.intern(filename.decode("ascii"))
         if filename not in self.tracked_files:
             return ("", {})
 
-        rest = parts[1].strip()
-        tokens = rest.split(" ")
-        if len(tokens) < 2:
-            return ("", {})
-
-        percent_token = tokens[0]
-        size_token = tokens[1]
+        return (filename, {"percent": int(percent), "downloaded": downloaded.decode(), "total": total.decode()})
 
-        if not percent_token.endswith("%"):
-            return ("", {})
+    def _update_file_dl_status(self, filename: str, status: dict) -> None:
+        """
+        Stores the download status of a file and keeps the set of fully
+        downloaded tracked files up to date.
 
-        try:
-            percent = int(percent_token.replace("%", ""))
-            downloaded, total = size_token.split("/")
-        except (ValueError, IndexError):
-            return ("", {})
+        Args:
+            filename (str): The file name, empty if the log line was not a tracked file progress.
+            status (dict): The download status as returned by _get_line_data().
+        """
+        self.files_dl_status[filename] = status
+        if not filename:
+            return
 
-        return (filename, {"percent": percent, "downloaded": downloaded, "total": total})
+        if status["percent"] >= 100:
+            self._completed_files.add(filename)
+        else:
+            self._completed_files.discard(filename)
 
     def is_download_complete(self) -> bool:
         """
@@ -173,11 +217,7 @@ class TransformerModelDownloadTracker:
         Returns:
             True if all files are fully downloaded, False otherwise.
         """
-        for filename in self.tracked_files:
-            data = self.files_dl_status.get(filename)
-            if not data or data["percent"] < 100:
-                return False
-        return True
+        return len(self._completed_files) == self._tracked_files_count
 
     def download_status(self) -> int:
         """
@@ -189,14 +229,23 @@ class TransformerModelDownloadTracker:
         Returns:
             An integer representing the percent of download completed (0-100).
         """
-        if not self.tracked_files:
-            return 0
-        return self.files_dl_status.get("model.safetensors", {}).get("percent", 0)
+        model_status = self.files_dl_status.get("model.safetensors")
+        return model_status["percent"] if model_status else 0
 
     def stop(self) -> None:
         """
         Stops the download watcher thread gracefully.
         """
-        self._dl_watcher_running = False
+        self._stop_event.set()
+        if self._wakeup_write_fd < 0:
+            # Already stopped
+            return
+
+        os.write(self._wakeup_write_fd, b"\0")
         if self._thread.is_alive():
             self._thread.join(timeout=1)
+        if not self._thread.is_alive():
+            # The watcher thread no longer waits on the pipe
+            os.close(self._wakeup_read_fd)
+            os.close(self._wakeup_write_fd)
+            self._wakeup_read_fd = self._wakeup_write_fd = -1
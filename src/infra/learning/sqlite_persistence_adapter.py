@@ -16,15 +16,48 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sqlite3
+import sys
+from contextlib import contextmanager
 from datetime import datetime
 from math import ceil
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 from src.config import MAX_RECORDS_PER_REVIEW_GROUP
 from src.domain.learning.learning_data_objects import ReviewGroup
 from src.domain.learning.learning_persistence_port import LearningPersistencePort
 
+# SQL statements are defined once so that every call reuses the statement
+# already compiled by the sqlite3 connection statement cache
+SQL_SELECT_REVIEW_GROUPS = (
+    "SELECT id, group_index, topic, last_review_date, next_review_date, reviews_count FROM review_groups"
+)
+SQL_SELECT_REVIEW_GROUP_BY_ID = f"{SQL_SELECT_REVIEW_GROUPS} WHERE id = ?"
+SQL_SELECT_REVIEW_GROUPS_FOR_TOPIC = f"{SQL_SELECT_REVIEW_GROUPS} WHERE topic = ?"
+SQL_COUNT_REVIEW_GROUPS_FOR_TOPIC = "SELECT COUNT(*) FROM review_groups WHERE topic = ?"
+SQL_INSERT_REVIEW_GROUP = (
+    "INSERT INTO review_groups (topic, group_index, last_review_date, next_review_date, reviews_count) "
+    "VALUES (?, ?, NULL, NULL, 0)"
+)
+SQL_UPDATE_REVIEW_GROUP_DATES_AND_COUNT = (
+    "UPDATE review_groups SET last_review_date=?, next_review_date=?, reviews_count=? WHERE id=?"
+)
+
+# Path of a private database living in memory, dropped when the adapter is closed
+IN_MEMORY_DB_PATH = ":memory:"
+
+# Write-ahead logging turns each commit into a sequential append instead of a
+# full rollback journal sync, which is safe enough with synchronous=NORMAL.
+# The page cache (64 MB at most) lets a long-lived connection keep the whole
+# review database in memory.
+SQL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
 
 class SQLitePersistenceAdapter(LearningPersistencePort):
     """
@@ -32,13 +65,24 @@ class SQLitePersistenceAdapter(LearningPersistencePort):
     Manages the persistence of learning information using an SQLite database.
     """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Union[Path, str], connection: Optional[sqlite3.Connection] = None) -> None:
         """
         Args:
-            path (Path): The file path to the SQLite database.
+            path (Union[Path, str]): The file path to the SQLite database, or IN_MEMORY_DB_PATH
+                for a database which is not persisted.
+            connection (Optional[sqlite3.Connection]): An already open connection to the database,
+                reused instead of opening a new one. It is left open when the adapter is closed.
         """
-        self.path: Path = path
+        self.path: Union[Path, str] = path
+        self._borrowed_connection: Optional[sqlite3.Connection] = connection
         self.sqlite_db: sqlite3.Connection
+        self._cursor: sqlite3.Cursor
+        self._in_batch: bool = False
+        # Results of frequent small queries, valid as long as the database is
+        # only modified through this adapter. Rows are cached rather than
+        # ReviewGroup objects because the latter are mutated by their users.
+        self._review_group_rows_cache: Dict[int, Tuple] = {}
+        self._review_groups_count_cache: Dict[str, int] = {}
 
     def __enter__(self):
         self.__init_persistence()
@@ -52,95 +96,143 @@ class SQLitePersistenceAdapter(LearningPersistencePort):
         Initialize the SQLite database, creating necessary tables if they do not exist.
         """
         try:
-            if not self.path.exists():
-                self.path.touch()
+            if self._borrowed_connection is not None:
+                self.sqlite_db = self._borrowed_connection
+            else:
+                if self.path != IN_MEMORY_DB_PATH and not Path(self.path).exists():
+                    Path(self.path).touch()
 
-            # Enable timestamp to datetime object conversion
-            sqlite3.register_converter("DATETIME", lambda x: datetime.fromisoformat(x.decode()))
-
-            # Connect to db with active converters (datetime)
-            self.sqlite_db = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES)
+                # Dates are stored as ISO strings and converted by the adapter itself
+                # (see _to_review_group()) rather than by a sqlite3 converter callback
+                self.sqlite_db = sqlite3.connect(self.path)
+                for pragma in SQL_PRAGMAS:
+                    self.sqlite_db.execute(pragma)
+            self._cursor = self.sqlite_db.cursor()
+            self.__clear_caches()
             self.__create_tables()
         except sqlite3.Error as e:
             print(f"Error when initializing SQLite persistence: {e}")
             raise
 
-    def get_review_group_by_id(self, id: int) -> ReviewGroup:
-        cursor = self.sqlite_db.cursor()
-        cursor.execute(
-            "SELECT id, group_index, topic, last_review_date, next_review_date, reviews_count FROM review_groups WHERE id = ?",
-            (id,),
-        )
-        result = cursor.fetchone()
-        cursor.close()
-        if result is None:
-            raise ValueError(f"Review group with id {id} not found")
-        return ReviewGroup(*result)
+    def reopen(self) -> None:
+        """
+        Closes the database connection and opens a new one, dropping cached query
+        results, e.g. to check that changes have actually been persisted.
+        """
+        self.__close()
+        self.__init_persistence()
 
-    def update_review_groups_for_topic(self, topic: str, count: int) -> None:
-        cursor = self.sqlite_db.cursor()
+    @contextmanager
+    def batch(self, rollback: bool = False) -> Iterator[None]:
+        """
+        Groups all changes made within the context into a single transaction,
+        committed when leaving the context or rolled back if an exception is
+        raised. Nested calls join the outermost transaction.
 
-        cursor.execute("SELECT COUNT(*) FROM review_groups WHERE topic = ?", (topic,))
-        existing_groups_number = cursor.fetchone()
+        Args:
+            rollback (bool): If True, changes are always rolled back when leaving
+                the context, e.g. to isolate tests sharing the same database.
+        """
+        if self._in_batch:
+            yield
+            return
 
-        if existing_groups_number is None:
-            existing_groups_number = 0
-        else:
-            existing_groups_number = existing_groups_number[0]
+        self._in_batch = True
+        try:
+            yield
+            if rollback:
+                self.sqlite_db.rollback()
+                self.__clear_caches()
+            else:
+                self.sqlite_db.commit()
+        except BaseException:
+            self.sqlite_db.rollback()
+            self.__clear_caches()
+            raise
+        finally:
+            self._in_batch = False
 
+    def get_review_group_by_id(self, id: int) -> ReviewGroup:
+        result = self._review_group_rows_cache.get(id)
+        if result is None:
+            self._cursor.execute(SQL_SELECT_REVIEW_GROUP_BY_ID, (id,))
+            result = self._cursor.fetchone()
+            if result is None:
+                raise ValueError(f"Review group with id {id} not found")
+            self._review_group_rows_cache[id] = result
+        return self._to_review_group(result)
+
+    def update_review_groups_for_topic(self, topic: str, count: int) -> None:
+        existing_groups_number = self.get_number_of_review_groups_for_topic(topic)
         required_groups = ceil(count / MAX_RECORDS_PER_REVIEW_GROUP)
 
         if required_groups > existing_groups_number:
-            for index in range(existing_groups_number, required_groups):
-                cursor.execute(
-                    "INSERT INTO review_groups (topic, group_index, last_review_date, next_review_date, reviews_count) VALUES (?, ?, NULL, NULL, 0)",
-                    (topic, index),
-                )
+            self._cursor.executemany(
+                SQL_INSERT_REVIEW_GROUP, ((topic, index) for index in range(existing_groups_number, required_groups))
+            )
+            self._review_groups_count_cache.pop(topic, None)
 
-        self.sqlite_db.commit()
-        cursor.close()
+        self.__commit()
 
     def get_review_groups_for_topic(self, topic: str) -> Tuple[ReviewGroup, ...]:
-        cursor = self.sqlite_db.cursor()
-        cursor.execute(
-            "SELECT id, group_index, topic, last_review_date, next_review_date, reviews_count FROM review_groups WHERE topic = ?",
-            (topic,),
-        )
-        result = tuple(ReviewGroup(*row) for row in cursor.fetchall())
-        cursor.close()
-        return result
+        self._cursor.execute(SQL_SELECT_REVIEW_GROUPS_FOR_TOPIC, (topic,))
+        return tuple(map(self._to_review_group, self._cursor.fetchall()))
 
     def get_all_review_groups(self) -> Tuple[ReviewGroup, ...]:
-        cursor = self.sqlite_db.cursor()
-        cursor.execute(
-            "SELECT id, group_index, topic, last_review_date, next_review_date, reviews_count FROM review_groups"
-        )
-        result = tuple(ReviewGroup(*row) for row in cursor.fetchall())
-        cursor.close()
-        return result
+        self._cursor.execute(SQL_SELECT_REVIEW_GROUPS)
+        return tuple(map(self._to_review_group, self._cursor.fetchall()))
 
     def update_review_group_dates_and_count(self, review_group: ReviewGroup) -> None:
-        cursor = self.sqlite_db.cursor()
-        sql_update = "UPDATE review_groups SET last_review_date=?, next_review_date=?, reviews_count=? WHERE id=?"
-        cursor.execute(
-            sql_update,
-            (review_group.last_review_date, review_group.next_review_date, review_group.reviews_count, review_group.id),
+        self._cursor.execute(
+            SQL_UPDATE_REVIEW_GROUP_DATES_AND_COUNT,
+            (
+                self._to_iso_date(review_group.last_review_date),
+                self._to_iso_date(review_group.next_review_date),
+                review_group.reviews_count,
+                review_group.id,
+            ),
         )
-        self.sqlite_db.commit()
-        cursor.close()
+        self._review_group_rows_cache.pop(review_group.id, None)
+        self.__commit()
 
     def get_number_of_review_groups_for_topic(self, topic: str) -> int:
-        cursor = self.sqlite_db.cursor()
+        existing_groups_number = self._review_groups_count_cache.get(topic)
+        if existing_groups_number is not None:
+            return existing_groups_number
 
-        cursor.execute("SELECT COUNT(*) FROM review_groups WHERE topic = ?", (topic,))
-        existing_groups_number = cursor.fetchone()
+        self._cursor.execute(SQL_COUNT_REVIEW_GROUPS_FOR_TOPIC, (topic,))
+        existing_groups_number = self._cursor.fetchone()
 
         if existing_groups_number is None:
             existing_groups_number = 0
         else:
             existing_groups_number = existing_groups_number[0]
+        self._review_groups_count_cache[topic] = existing_groups_number
         return existing_groups_number
 
+    @staticmethod
+    def _to_review_group(row: Tuple) -> ReviewGroup:
+        """
+        Builds a ReviewGroup from a review_groups row, converting ISO date strings to datetime objects.
+        Topics are interned so that all groups of a topic share the same string object.
+        """
+        id, group_index, topic, last_review_date, next_review_date, reviews_count = row
+        return ReviewGroup(
+            id,
+            group_index,
+            sys.intern(topic),
+            datetime.fromisoformat(last_review_date) if last_review_date is not None else None,
+            datetime.fromisoformat(next_review_date) if next_review_date is not None else None,
+            reviews_count,
+        )
+
+    @staticmethod
+    def _to_iso_date(date: Optional[datetime]) -> Optional[str]:
+        """
+        Formats a datetime the way review dates are stored in database.
+        """
+        return date.isoformat(" ") if date is not None else None
+
     def __create_tables(self) -> None:
         """
         Create tables in the SQLite database if they do not already exist.
@@ -158,9 +250,25 @@ class SQLitePersistenceAdapter(LearningPersistencePort):
         """)
         self.sqlite_db.commit()
 
+    def __commit(self) -> None:
+        """
+        Commits the current transaction, unless changes are grouped by batch().
+        """
+        if not self._in_batch:
+            self.sqlite_db.commit()
+
+    def __clear_caches(self) -> None:
+        """
+        Drops cached query results, e.g. when they may no longer match the database content.
+        """
+        self._review_group_rows_cache.clear()
+        self._review_groups_count_cache.clear()
+
     def __close(self) -> None:
         """
-        Closes the SQLite database connection.
+        Closes the SQLite database connection, unless it was provided when creating the adapter.
         """
         if self.sqlite_db:
-            self.sqlite_db.close()
+            self._cursor.close()
+            if self._borrowed_connection is None:
+                self.sqlite_db.close()
@@ -15,26 +15,34 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import sqlite3
 import sys
 from argparse import Namespace
 from typing import Dict
 
 from src.environment import init_env
-from src.infra.cli.cli_apdapter import ask, review, show, do_list, stop
 from src.infra.cli.cli_parse import parse_args
 
-COMMANDS = {"ask": ask, "list": do_list, "show": show, "review": review, "stop": stop}
+# Commands are mapped to the name of their handler in cli_apdapter, which is
+# only imported once a command has to run (see execute_command())
+COMMANDS = {"ask": "ask", "list": "do_list", "show": "show", "review": "review", "stop": "stop"}
 
 
 def execute_command(function, *args, **kwargs):
     """
     Provides flexible command handling by allowing the same function to invoke
     commands with or without arguments seamlessly.
+    The CLI adapter is imported here rather than at module level because it
+    pulls heavy UI libraries, which are useless for --help, --version or a
+    parsing error.
     """
+    from src.infra.cli import cli_apdapter
+
+    command = getattr(cli_apdapter, COMMANDS[function])
     if args and args[0]:
-        return COMMANDS[function](*args, **kwargs)
+        return command(*args, **kwargs)
     else:
-        return COMMANDS[function]()
+        return command()
 
 
 def get_arguments(args: Namespace) -> Dict:
@@ -45,8 +53,12 @@ def get_arguments(args: Namespace) -> Dict:
     For example, it might return {"topic_name": "bash"}, where
     "topic_name" is an argument for the "show" command. Refer to parse_args()
     for more details.
+    Notice that the returned dictionary is the namespace's own attribute
+    dictionary, so "command" is removed from args as well: read it before.
     """
-    return {key: value for key, value in vars(args).items() if key != "command"}
+    arguments = vars(args)
+    arguments.pop("command", None)
+    return arguments
 
 
 def main():
@@ -58,7 +70,9 @@ def main():
         execute_command(cmd, cmd_args)
     except KeyboardInterrupt:
         print("Interrupted by user.")
-    except Exception as e:
+    except (RuntimeError, OSError, ValueError, sqlite3.Error) as e:
+        # Expected failures (daemon/socket, files, review database) are reported
+        # to the user, anything else is a bug and must not be hidden
         print(f"Error : {e}")
 
 
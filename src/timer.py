@@ -17,12 +17,11 @@
 
 import time
 
-starting_time = time.time()
+starting_time = time.monotonic_ns()
 
 def print_elapsed_time(stage:str):
-    elapsed_seconds = time.time() - starting_time 
-    if elapsed_seconds < 1:
-        elapsed_milliseconds = elapsed_seconds * 1000
-        print(f"Temps écoulé ({stage}): {elapsed_milliseconds:.2f} millisecondes")
+    elapsed_nanoseconds = time.monotonic_ns() - starting_time
+    if elapsed_nanoseconds < 1_000_000_000:
+        print(f"Temps écoulé ({stage}): {elapsed_nanoseconds / 1e6:.2f} millisecondes")
     else:
-        print(f"Temps écoulé ({stage}): {elapsed_seconds:.2f} secondes")
\ No newline at end of file
+        print(f"Temps écoulé ({stage}): {elapsed_nanoseconds / 1e9:.2f} secondes")
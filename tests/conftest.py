@@ -0,0 +1,47 @@
+# Lia is a knowledge base organizer providing fast and accurate natural
+# language search from the command line.
+# Copyright (C) 2025  Pierre Giusti
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+
+import pytest
+
+from src.infra.knowledge.sentence_similarity.sentence_transformer_daemon_adapter import SentenceTransformerDaemonAdapter
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """
+    Runs the tests marked as serial first. These tests start and stop the
+    daemon themselves, and there is only one daemon per user: they must be
+    done before the shared daemon is started.
+    """
+    items.sort(key=lambda item: item.get_closest_marker("serial") is None)
+
+
+@pytest.fixture(scope="session")
+def shared_daemon():
+    """
+    Sentence transformer daemon shared by all the tests of the session, so that
+    the model is loaded only once per pytest run.
+    """
+    logger.debug("Setup : starting shared sentence transformer daemon")
+    sentence_similarity_checker = SentenceTransformerDaemonAdapter()
+    sentence_similarity_checker.start()
+    yield sentence_similarity_checker
+    logger.debug("Teardown : stopping shared sentence transformer daemon")
+    sentence_similarity_checker.stop()
@@ -20,6 +20,23 @@ from datetime import datetime
 from src.domain.knowledge.knowledge_data_objects import KnowledgeRecord
 from src.domain.learning.learning_data_objects import ReviewGroup
 
+# Review dates are built once and shared by all the expected review groups
+DATE_2025_01_18 = datetime(2025, 1, 18, 0, 0)
+DATE_2025_01_23 = datetime(2025, 1, 23, 0, 0)
+DATE_2025_02_10 = datetime(2025, 2, 10, 0, 0)
+DATE_2025_02_17 = datetime(2025, 2, 17, 0, 0)
+DATE_2025_02_22 = datetime(2025, 2, 22, 0, 0)
+DATE_2025_02_24 = datetime(2025, 2, 24, 0, 0)
+DATE_2025_02_25 = datetime(2025, 2, 25, 0, 0)
+DATE_2025_02_27 = datetime(2025, 2, 27, 0, 0)
+DATE_2025_03_02 = datetime(2025, 3, 2, 0, 0)
+DATE_2025_03_03 = datetime(2025, 3, 3, 0, 0)
+DATE_2025_03_09 = datetime(2025, 3, 9, 0, 0)
+DATE_2025_03_11 = datetime(2025, 3, 11, 0, 0)
+DATE_2025_03_12 = datetime(2025, 3, 12, 0, 0)
+DATE_2025_03_22 = datetime(2025, 3, 22, 0, 0)
+DATE_2025_03_27 = datetime(2025, 3, 27, 0, 0)
+
 EXPECTED_BASH_REVIEW_GROUPS = (
     ReviewGroup(
         id=1,
@@ -109,8 +126,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=10,
         group_index=0,
         topic="curl",
-        last_review_date=datetime(2025, 2, 10, 0, 0),
-        next_review_date=datetime(2025, 2, 17, 0, 0),
+        last_review_date=DATE_2025_02_10,
+        next_review_date=DATE_2025_02_17,
         reviews_count=2,
     ),
     # Oldest overdue review / few count / alphabetical
@@ -118,8 +135,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=14,
         group_index=0,
         topic="python",
-        last_review_date=datetime(2025, 2, 10, 0, 0),
-        next_review_date=datetime(2025, 2, 17, 0, 0),
+        last_review_date=DATE_2025_02_10,
+        next_review_date=DATE_2025_02_17,
         reviews_count=2,
     ),
     # Oldest overdue review / most count
@@ -127,8 +144,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=1,
         group_index=0,
         topic="ad",
-        last_review_date=datetime(2025, 1, 18, 0, 0),
-        next_review_date=datetime(2025, 2, 17, 0, 0),
+        last_review_date=DATE_2025_01_18,
+        next_review_date=DATE_2025_02_17,
         reviews_count=3,
     ),
     # Oldest overdue review / most count / alphabetical
@@ -136,8 +153,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=4,
         group_index=0,
         topic="bash",
-        last_review_date=datetime(2025, 1, 18, 0, 0),
-        next_review_date=datetime(2025, 2, 17, 0, 0),
+        last_review_date=DATE_2025_01_18,
+        next_review_date=DATE_2025_02_17,
         reviews_count=3,
     ),
     # Overdue review / less count
@@ -145,8 +162,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=5,
         group_index=1,
         topic="bash",
-        last_review_date=datetime(2025, 1, 23, 0, 0),
-        next_review_date=datetime(2025, 2, 22, 0, 0),
+        last_review_date=DATE_2025_01_23,
+        next_review_date=DATE_2025_02_22,
         reviews_count=1,
     ),
     # Overdue review / less count / alphabetical
@@ -154,8 +171,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=15,
         group_index=1,
         topic="python",
-        last_review_date=datetime(2025, 1, 23, 0, 0),
-        next_review_date=datetime(2025, 2, 22, 0, 0),
+        last_review_date=DATE_2025_01_23,
+        next_review_date=DATE_2025_02_22,
         reviews_count=1,
     ),
     # Overdue review / most count
@@ -163,8 +180,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=2,
         group_index=1,
         topic="ad",
-        last_review_date=datetime(2025, 1, 23, 0, 0),
-        next_review_date=datetime(2025, 2, 22, 0, 0),
+        last_review_date=DATE_2025_01_23,
+        next_review_date=DATE_2025_02_22,
         reviews_count=2,
     ),
     # Overdue review / most count / alphabetical
@@ -172,8 +189,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=6,
         group_index=2,
         topic="bash",
-        last_review_date=datetime(2025, 1, 23, 0, 0),
-        next_review_date=datetime(2025, 2, 22, 0, 0),
+        last_review_date=DATE_2025_01_23,
+        next_review_date=DATE_2025_02_22,
         reviews_count=2,
     ),
     # Current day review less count
@@ -181,8 +198,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=11,
         group_index=1,
         topic="curl",
-        last_review_date=datetime(2025, 3, 2, 0, 0),
-        next_review_date=datetime(2025, 3, 3, 0, 0),
+        last_review_date=DATE_2025_03_02,
+        next_review_date=DATE_2025_03_03,
         reviews_count=1,
     ),
     # Current day review less count / alphabetical
@@ -190,8 +207,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=16,
         group_index=2,
         topic="python",
-        last_review_date=datetime(2025, 3, 2, 0, 0),
-        next_review_date=datetime(2025, 3, 3, 0, 0),
+        last_review_date=DATE_2025_03_02,
+        next_review_date=DATE_2025_03_03,
         reviews_count=1,
     ),
     # Current day review most count
@@ -199,8 +216,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=7,
         group_index=3,
         topic="bash",
-        last_review_date=datetime(2025, 2, 24, 0, 0),
-        next_review_date=datetime(2025, 3, 3, 0, 0),
+        last_review_date=DATE_2025_02_24,
+        next_review_date=DATE_2025_03_03,
         reviews_count=2,
     ),
     # Current day review most count / alphabetical
@@ -208,8 +225,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=12,
         group_index=2,
         topic="curl",
-        last_review_date=datetime(2025, 2, 24, 0, 0),
-        next_review_date=datetime(2025, 3, 3, 0, 0),
+        last_review_date=DATE_2025_02_24,
+        next_review_date=DATE_2025_03_03,
         reviews_count=2,
     ),
     # Future review less count
@@ -217,8 +234,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=3,
         group_index=2,
         topic="ad",
-        last_review_date=datetime(2025, 3, 2, 0, 0),
-        next_review_date=datetime(2025, 3, 9, 0, 0),
+        last_review_date=DATE_2025_03_02,
+        next_review_date=DATE_2025_03_09,
         reviews_count=1,
     ),
     # Future review less count / alphabetical
@@ -226,8 +243,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=8,
         group_index=4,
         topic="bash",
-        last_review_date=datetime(2025, 3, 2, 0, 0),
-        next_review_date=datetime(2025, 3, 9, 0, 0),
+        last_review_date=DATE_2025_03_02,
+        next_review_date=DATE_2025_03_09,
         reviews_count=1,
     ),
     # Future review most count /
@@ -235,8 +252,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=9,
         group_index=5,
         topic="bash",
-        last_review_date=datetime(2025, 2, 25, 0, 0),
-        next_review_date=datetime(2025, 3, 27, 0, 0),
+        last_review_date=DATE_2025_02_25,
+        next_review_date=DATE_2025_03_27,
         reviews_count=2,
     ),
     # Future review most count / alphabetical
@@ -244,8 +261,8 @@ EXPECTED_ORDERED_GROUPS_TO_REVIEW = (
         id=13,
         group_index=3,
         topic="curl",
-        last_review_date=datetime(2025, 2, 25, 0, 0),
-        next_review_date=datetime(2025, 3, 27, 0, 0),
+        last_review_date=DATE_2025_02_25,
+        next_review_date=DATE_2025_03_27,
         reviews_count=2,
     ),
 )
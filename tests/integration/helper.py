@@ -0,0 +1,87 @@
+# Lia is a knowledge base organizer providing fast and accurate natural
+# language search from the command line.
+# Copyright (C) 2025  Pierre Giusti
+# 
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from src.domain.knowledge.sentence_similarity_port import SentenceSimilarityPort
+from src.environment import MODEL_NAME
+
+"""
+Helper for end to end tests: sentence similarity results are cached on disk, so
+that the model is only needed the first time a query is made against the dataset.
+"""
+
+TESTS_DIR: Path = Path(__file__).resolve().parent.parent
+SIMILARITY_CACHE_PATH = Path(TESTS_DIR, ".cache", "similarity")
+
+
+class CachedSentenceSimilarityAdapter(SentenceSimilarityPort):
+    """
+    Sentence similarity adapter memoizing on disk the rankings of another adapter.
+
+    Rankings are stored as JSON files, named after a hash of the model name and of
+    the rank_similarities() arguments. Since candidate sentences are part of the key,
+    any change in the dataset leads to a cache miss. The underlying adapter is only
+    retrieved (and thus started) on the first cache miss.
+    """
+
+    def __init__(
+        self,
+        get_sentence_similarity_checker: Callable[[], SentenceSimilarityPort],
+        cache_path: Path = SIMILARITY_CACHE_PATH,
+    ) -> None:
+        """
+        Args:
+            get_sentence_similarity_checker (Callable): Returns the adapter used on cache miss.
+            cache_path (Path): The directory where rankings are stored.
+        """
+        self.__get_sentence_similarity_checker = get_sentence_similarity_checker
+        self.__sentence_similarity_checker: Optional[SentenceSimilarityPort] = None
+        self.__cache_path = cache_path
+
+    def rank_similarities(
+        self, input_sentence: str, candidate_sentences: Tuple[str, ...], top_n: int
+    ) -> Tuple[Tuple[int, float], ...]:
+        key = hashlib.blake2b(
+            json.dumps((MODEL_NAME, input_sentence, candidate_sentences, top_n)).encode("utf-8")
+        ).hexdigest()
+        cache_file = Path(self.__cache_path, f"{key}.json")
+
+        if cache_file.exists():
+            return tuple((index, score) for index, score in json.loads(cache_file.read_text(encoding="utf-8")))
+
+        if self.__sentence_similarity_checker is None:
+            self.__sentence_similarity_checker = self.__get_sentence_similarity_checker()
+        ranking = self.__sentence_similarity_checker.rank_similarities(input_sentence, candidate_sentences, top_n)
+
+        self.__cache_path.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(ranking), encoding="utf-8")
+        return ranking
+
+    def start(self) -> None:
+        # The underlying adapter is started on demand, on the first cache miss
+        pass
+
+    def stop(self) -> None:
+        # The underlying adapter lifecycle is managed by whoever provides it
+        pass
+
+    def is_running(self) -> bool:
+        return self.__sentence_similarity_checker is not None and self.__sentence_similarity_checker.is_running()
@@ -24,7 +24,11 @@ import pytest
 from src.environment import SOCKET_PATH
 from src.infra.knowledge.sentence_similarity.daemon_process_handler import DeamonProcessHandler
 
+# The daemon is unique (one per user): tests using it must run on the same xdist worker
+pytestmark = pytest.mark.xdist_group("sentence_transformer_daemon")
 
+
+@pytest.mark.serial
 def test_daemon_socket_start_and_stop() -> None:
     # Arrange
     daemon_process_handler = DeamonProcessHandler()
@@ -62,6 +66,7 @@ def test_daemon_socket_start_and_stop() -> None:
         assert False, f"Error occured when stopping daemon : {e}"
 
 
+@pytest.mark.serial
 def test_daemon_kill_on_terminate_fail(mocker):
     # Arrange
     # mock terminate() function to disable it and be sure that if terminate
@@ -81,63 +86,31 @@ def test_daemon_kill_on_terminate_fail(mocker):
     assert not os.path.exists(SOCKET_PATH), f"Socket path {SOCKET_PATH} does not exist."
 
 
-def test_daemon_proc_no_such_proc(mocker):
+@pytest.fixture
+def patched_process_iter(mocker, exception_class):
     """
-    This test simulates a case where a process searched by DeamonProcessHandler does
-    not exist or is inaccessible by manipulating the behavior of psutil.process_iter
-    and the objects it returns. It validates that the start_daemon method handles
-    this situation correctly by raising a psutil.NoSuchProcess exception
+    Patches psutil.process_iter so that it returns a process whose information
+    raises the given psutil exception when accessed.
     """
-    # Arrange
-    mock_process_iter = mocker.patch("psutil.process_iter", autospec=True)
     mock_proc = mocker.Mock()
     mock_proc.info = mocker.MagicMock()
-    mock_proc.info.__getitem__.side_effect = psutil.NoSuchProcess(1)
-    mock_process_iter.return_value = iter([mock_proc])
-
-    # Act & Assert
-    daemon_process_handler = DeamonProcessHandler()
-    with pytest.raises(psutil.NoSuchProcess):
-        daemon_process_handler.start_daemon()
+    mock_proc.info.__getitem__.side_effect = exception_class(1)
+    mocker.patch("psutil.process_iter", autospec=True, return_value=iter([mock_proc]))
 
 
-def test_daemon_proc_access_denied(mocker):
+@pytest.mark.parametrize("exception_class", [psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess])
+@pytest.mark.usefixtures("patched_process_iter")
+def test_daemon_proc_error(exception_class):
     """
-    This test simulates a case where access to a process's information is denied
-    while DeamonProcessHandler is searching for a specific process. By manipulating
-    the behavior of psutil.process_iter and the objects it returns, it ensures that
-    the start_daemon method correctly raises a psutil.AccessDenied exception in such
-    scenarios.
+    This test simulates cases where a process searched by DeamonProcessHandler does
+    not exist, is inaccessible, or is in a zombie state, by manipulating the behavior
+    of psutil.process_iter and the objects it returns. It validates that the
+    start_daemon method properly raises the corresponding psutil exception in these
+    situations.
     """
     # Arrange
-    mock_process_iter = mocker.patch("psutil.process_iter", autospec=True)
-    mock_proc = mocker.Mock()
-    mock_proc.info = mocker.MagicMock()
-    mock_proc.info.__getitem__.side_effect = psutil.AccessDenied(1)
-    mock_process_iter.return_value = iter([mock_proc])
-    daemon_process_handler = DeamonProcessHandler()
-
-    # Act & Assert
-    with pytest.raises(psutil.AccessDenied):
-        daemon_process_handler.start_daemon()
-
-
-def test_daemon_proc_zombie(mocker):
-    """
-    This test simulates a case where a process searched by DeamonProcessHandler is
-    in a zombie state, making its information inaccessible. By manipulating the
-    behavior of psutil.process_iter and the objects it returns, it validates that
-    the start_daemon method properly raises a psutil.ZombieProcess exception in this
-    situation.
-    """
-    # Arrange
-    mock_process_iter = mocker.patch("psutil.process_iter", autospec=True)
-    mock_proc = mocker.Mock()
-    mock_proc.info = mocker.MagicMock()
-    mock_proc.info.__getitem__.side_effect = psutil.ZombieProcess(1)
-    mock_process_iter.return_value = iter([mock_proc])
     daemon_process_handler = DeamonProcessHandler()
 
     # Act & Assert
-    with pytest.raises(psutil.ZombieProcess):
+    with pytest.raises(exception_class):
         daemon_process_handler.start_daemon()
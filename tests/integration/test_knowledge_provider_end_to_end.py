@@ -15,13 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import logging
 from pathlib import Path
 
 import pytest
 
 from src.domain.knowledge.knowledge_provider import KnowledgeProvider
 from src.infra.knowledge.file.file_persistence_adapter import FilePersistenceAdapter
-from src.infra.knowledge.sentence_similarity.sentence_transformer_daemon_adapter import SentenceTransformerDaemonAdapter
 from tests.expected_results.test_knowledge_provider_expected_results import (
     EXPECTED_TOP_1_ANSWER_AD_1,
     EXPECTED_TOP_1_ANSWER_AD_2,
@@ -34,62 +34,67 @@ from tests.expected_results.test_knowledge_provider_expected_results import (
     EXPECTED_TOP_3_HEADINGS_CURL,
     EXPECTED_TOP_3_HEADINGS_ENUMERATE,
 )
+from tests.integration.helper import CachedSentenceSimilarityAdapter
 
 TESTS_DIR: Path = Path(__file__).resolve().parent.parent
 
+logger = logging.getLogger(__name__)
+
+# The daemon is unique (one per user): tests using it must run on the same xdist worker
+pytestmark = pytest.mark.xdist_group("sentence_transformer_daemon")
+
 
 @pytest.fixture(scope="module")
-def knowledge_provider():
-    print("\nSetup : starting knowledge provider")
+def knowledge_provider(request):
+    logger.debug("Setup : starting knowledge provider")
     persistence = FilePersistenceAdapter(f"{TESTS_DIR}/tests_data/dataset_example")
-    sentence_similarity_checker = SentenceTransformerDaemonAdapter()
-    sentence_similarity_checker.start()
+    # Rankings are cached on disk: the shared daemon is only started if a query is not cached yet
+    sentence_similarity_checker = CachedSentenceSimilarityAdapter(lambda: request.getfixturevalue("shared_daemon"))
     knowledge_provider = KnowledgeProvider(persistence, sentence_similarity_checker)
     yield knowledge_provider  # L'objet est utilisé par les tests
-    print("\nTeardown : stopping knowledge provider")
-    sentence_similarity_checker.stop()
-    del knowledge_provider
-
-
-def test_should_seek_matches_for_a_given_query(knowledge_provider):
-    result = knowledge_provider.ask("How to check if an array contains a given value in bash?")
-
-    # Then
-
-    assert result[0] == EXPECTED_TOP_3_HEADINGS_BASH_1, f"Actual headings = {result[0]}"
-
-    assert result[1] == EXPECTED_TOP_1_ANSWER_BASH, f"Actual answer = {result[1]}"
-
-
-def test_should_find_match_in_file_containing_only_one_heading(knowledge_provider):
-    result = knowledge_provider.ask("How to use session cookie with curl ?")
-
-    assert result[0] == EXPECTED_TOP_3_HEADINGS_CURL, f"Actual headings = {result[0]}"
-
-    assert result[1] == EXPECTED_TOP_1_ANSWER_CURL, f"Actual answer = {result[1]}"
-
-
-def test_should_seek_results_even_if_topic_is_unknown(knowledge_provider):
-    result = knowledge_provider.ask("enumerate directories ?")
-
-    assert result[0] == EXPECTED_TOP_3_HEADINGS_ENUMERATE, f"Actual headings = {result[0]}"
-
-    assert result[1] == EXPECTED_TOP_1_ANSWER_ENUMERATE, f"Actual answer = {result[1]}"
-
-
-def test_should_return_matches_for_a_record_with_an_alternative_heading(knowledge_provider) -> None:
-    result = knowledge_provider.ask("Which file contains users and password information in AD?")
-
-    # Then
-    assert result[0] == EXPECTED_TOP_2_HEADINGS_AD, f"Actual headings = {result[0]}"
-
-    assert result[1] == EXPECTED_TOP_1_ANSWER_AD_1, f"Actual answer = {result[1]}"
-
-
-def test_should_return_only_one_heading_for_a_record_with_multiple_alternative_headings(knowledge_provider) -> None:
-    result = knowledge_provider.ask("What does the SYSVOL folder contain in AD?")
+    logger.debug("Teardown : stopping knowledge provider")
+
+
+@pytest.mark.parametrize(
+    "query, expected_headings, expected_answer",
+    [
+        pytest.param(
+            "How to check if an array contains a given value in bash?",
+            EXPECTED_TOP_3_HEADINGS_BASH_1,
+            EXPECTED_TOP_1_ANSWER_BASH,
+            id="matches_for_a_given_query",
+        ),
+        pytest.param(
+            "How to use session cookie with curl ?",
+            EXPECTED_TOP_3_HEADINGS_CURL,
+            EXPECTED_TOP_1_ANSWER_CURL,
+            id="match_in_file_containing_only_one_heading",
+        ),
+        pytest.param(
+            "enumerate directories ?",
+            EXPECTED_TOP_3_HEADINGS_ENUMERATE,
+            EXPECTED_TOP_1_ANSWER_ENUMERATE,
+            id="results_even_if_topic_is_unknown",
+        ),
+        pytest.param(
+            "Which file contains users and password information in AD?",
+            EXPECTED_TOP_2_HEADINGS_AD,
+            EXPECTED_TOP_1_ANSWER_AD_1,
+            id="matches_for_a_record_with_an_alternative_heading",
+        ),
+        pytest.param(
+            "What does the SYSVOL folder contain in AD?",
+            EXPECTED_TOP_1_HEADING_AD,
+            EXPECTED_TOP_1_ANSWER_AD_2,
+            id="only_one_heading_for_a_record_with_multiple_alternative_headings",
+        ),
+    ],
+)
+def test_should_seek_matches_for_a_given_query(knowledge_provider, query, expected_headings, expected_answer) -> None:
+    # When
+    result = knowledge_provider.ask(query)
 
     # Then
-    assert result[0] == EXPECTED_TOP_1_HEADING_AD, f"Actual headings = {result[0]}"
+    assert result[0] == expected_headings, f"Actual headings = {result[0]}"
 
-    assert result[1] == EXPECTED_TOP_1_ANSWER_AD_2, f"Actual answer = {result[1]}"
+    assert result[1] == expected_answer, f"Actual answer = {result[1]}"
@@ -22,6 +22,21 @@ import pytest
 from src.infra.knowledge.sentence_similarity.sockets import ClientSocket
 
 
+def mock_recv_into(chunks):
+    """
+    Returns a socket.recv_into() replacement writing the given chunks, one per call,
+    into the receiving buffer.
+    """
+    chunks_iterator = iter(chunks)
+
+    def recv_into(buffer, nbytes=0):
+        chunk = next(chunks_iterator)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 def test_should_raise_error_if_socket_is_not_connected(mocker) -> None:
     with pytest.raises(ConnectionError, match="Socket is not connected."):
         with ClientSocket() as socket:
@@ -29,9 +44,9 @@ def test_should_raise_error_if_socket_is_not_connected(mocker) -> None:
 
 
 def test_should_raise_error_if_data_size_is_incomplete(mocker):
-    # Mock socket receive less than 4 bytes for response size
+    # Mock socket receive less than 4 bytes for response size, then a connection close
     mock_socket = mocker.MagicMock(spec=socket.socket)
-    mock_socket.recv.side_effect = [b"\x00\x01"]
+    mock_socket.recv_into.side_effect = mock_recv_into([b"\x00\x01", b""])
 
     with pytest.raises(RuntimeError, match="Socket - Failed to receive the data size"):
         ClientSocket.from_socket(mock_socket).receive()
@@ -44,7 +59,7 @@ def test_should_raise_error_when_connection_close_while_receiving(mocker):
     # mock_socket = mocker.patch('socket.socket')
     # mock_instance = mock_socket.return_value
     mock_socket = mocker.MagicMock(spec=socket.socket)
-    mock_socket.recv.side_effect = [b"\x00\x00\x00\x08", b"\x01\x02\x03", b""]
+    mock_socket.recv_into.side_effect = mock_recv_into([b"\x00\x00\x00\x08", b"\x01\x02\x03", b""])
 
     with pytest.raises(RuntimeError, match="Socket - Socket connection closed unexpectedly"):
         ClientSocket.from_socket(mock_socket).receive()
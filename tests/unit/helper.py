@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
 import sqlite3
 from pathlib import Path
 
@@ -27,33 +28,47 @@ a fresh (cache clean) instance, which has to be deleted after every tests run.
 TESTS_DIR: Path = Path(__file__).resolve().parent.parent
 DATASET_PATH = Path(TESTS_DIR, "tests_data", "dataset_example")
 SQL_FOR_MOCKING_REVIEW_DB_PATH = Path(TESTS_DIR, "tests_data", "mock_review_db.sql")
-MOCKED_REVIEW_DB_PATH = Path(TESTS_DIR, "tests_data", "mocked_review_db.sqlite")
-REVIEW_DB_FROM_DATASET_PATH = Path(TESTS_DIR, "tests_data", "review_db_from_dataset.sqlite")
+# Each pytest-xdist worker (gw0, gw1...) gets its own database files, empty when not running with xdist
+XDIST_WORKER_SUFFIX = f"_{os.environ['PYTEST_XDIST_WORKER']}" if "PYTEST_XDIST_WORKER" in os.environ else ""
+MOCKED_REVIEW_DB_PATH = Path(TESTS_DIR, "tests_data", f"mocked_review_db{XDIST_WORKER_SUFFIX}.sqlite")
+REVIEW_DB_FROM_DATASET_PATH = Path(TESTS_DIR, "tests_data", f"review_db_from_dataset{XDIST_WORKER_SUFFIX}.sqlite")
+
+# The mocked review database is thrown away at the end of the session: its creation
+# does not need to be synced to disk, nor journaled in a file
+SQL_TEST_DB_PRAGMAS = """
+    PRAGMA synchronous=OFF;
+    PRAGMA journal_mode=MEMORY;
+"""
 
 
 def create_mocked_review_db():
+    """
+    Creates the mocked review database file by running the SQL script in a single transaction.
+    """
     try:
-        if not MOCKED_REVIEW_DB_PATH.exists():
-            MOCKED_REVIEW_DB_PATH.touch()
-
-        with SQL_FOR_MOCKING_REVIEW_DB_PATH.open("r", encoding="utf-8") as file:
-            sql_script = file.read()
-
-        with sqlite3.connect(MOCKED_REVIEW_DB_PATH) as connection:
-            cursor = connection.cursor()
-            cursor.executescript(sql_script)
-            connection.commit()
+        sql_script = SQL_FOR_MOCKING_REVIEW_DB_PATH.read_text(encoding="utf-8")
+        connection = sqlite3.connect(MOCKED_REVIEW_DB_PATH)
+        try:
+            connection.executescript(f"{SQL_TEST_DB_PRAGMAS}\nBEGIN;\n{sql_script}\nCOMMIT;")
+        finally:
+            connection.close()
 
     except Exception as e:
         print(f"Error when initializing test database: {e}")
         raise
 
 
+def remove_sqlite_db(path: Path) -> None:
+    """
+    Removes a SQLite database file, along with its write-ahead log and shared memory files.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+
 def remove_mocked_review_db():
-    if MOCKED_REVIEW_DB_PATH.exists():
-        MOCKED_REVIEW_DB_PATH.unlink()
+    remove_sqlite_db(MOCKED_REVIEW_DB_PATH)
 
 
 def remove_review_db_from_dataset():
-    if REVIEW_DB_FROM_DATASET_PATH.exists():
-        REVIEW_DB_FROM_DATASET_PATH.unlink()
+    remove_sqlite_db(REVIEW_DB_FROM_DATASET_PATH)
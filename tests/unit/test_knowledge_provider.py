@@ -35,18 +35,38 @@ from tests.expected_results.test_knowledge_provider_expected_results import (
 
 TESTS_DIR: Path = Path(__file__).resolve().parent.parent
 
+# Mocked directories and files arborescence, as returned by os.walk()
+MOCKED_DATASET_WALK = (
+    ("/root", ("cheat", "note"), ()),
+    ("/root/cheat", (), ("bash.md", "python.md", "rust.md", "vscode-python.md")),
+    ("/root/note", (), ("bash.md", "c++.md", "greenclip.md", "python.md")),
+)
+
+
+@pytest.fixture(scope="module")
+def persistence():
+    """
+    File persistence on the example dataset, shared by all tests of the module
+    """
+    yield FilePersistenceAdapter(Path(f"{TESTS_DIR}/tests_data/dataset_example"))
+    FilePersistenceAdapter.clear_cache()
+
+
+@pytest.fixture(scope="module")
+def knowledge_provider(persistence) -> KnowledgeProvider:
+    """
+    Knowledge provider without sentence similarity support, shared by all tests of the module
+    """
+    return KnowledgeProvider(persistence)
+
 
 @pytest.fixture
 def mock_os_walk(mocker) -> None:
     """
-    Mock directories and files arborescence
+    Mock directories and files arborescence.
+    The patch stays function scoped: the other tests of the module walk the real dataset.
     """
-    mock = mocker.patch("os.walk")
-    mock.return_value = [
-        ("/root", ("cheat", "note"), ()),
-        ("/root/cheat", (), ("bash.md", "python.md", "rust.md", "vscode-python.md")),
-        ("/root/note", (), ("bash.md", "c++.md", "greenclip.md", "python.md")),
-    ]
+    mocker.patch("os.walk", return_value=MOCKED_DATASET_WALK)
 
 
 def test_should_return_all_topics_with_the_support_of_a_file_persistance(mock_os_walk) -> None:
@@ -61,11 +81,7 @@ def test_should_return_all_topics_with_the_support_of_a_file_persistance(mock_os
     assert topics == EXPECTED_TOPICS, f"Actual topics = {topics}"
 
 
-def test_should_return_heading_list_from_a_given_topic_with_the_support_of_a_file_persistence() -> None:
-    # Given
-    persistence = FilePersistenceAdapter(Path(f"{TESTS_DIR}/tests_data/dataset_example"))
-    knowledge_provider = KnowledgeProvider(persistence)
-
+def test_should_return_heading_list_from_a_given_topic_with_the_support_of_a_file_persistence(knowledge_provider) -> None:
     # When
     heading_list = tuple(
         (record_heading.text, record_heading.tags)
@@ -107,11 +123,7 @@ def test_should_return_top_3_similar_headings_and_top_1_content_when_asked(mocke
     assert result[1] == EXPECTED_TOP_1_ANSWER_BASH, f"Actual answer = {result[1]}"
 
 
-def test_should_return_content_for_identified_heading() -> None:
-    # Given
-    persistence = FilePersistenceAdapter(Path(f"{TESTS_DIR}/tests_data/dataset_example"))
-    knowledge_provider = KnowledgeProvider(persistence)
-
+def test_should_return_content_for_identified_heading(knowledge_provider) -> None:
     # When
     heading_id = 191  # Line number of heading "How to check for the presence of a value in an array in Bash?" in bash.md
     content = knowledge_provider.get_content_for_identified_heading("bash", heading_id)
@@ -151,11 +163,7 @@ def test_should_return_top_3_similar_headings_and_no_content_if_max_similarity_s
     assert result[1] == ""
 
 
-def test_should_return_command_extracted_from_a_record_which_is_tagged_as_command() -> None:
-    # Given
-    persistence = FilePersistenceAdapter(Path(f"{TESTS_DIR}/tests_data/dataset_example"))
-    knowledge_provider = KnowledgeProvider(persistence)
-
+def test_should_return_command_extracted_from_a_record_which_is_tagged_as_command(knowledge_provider) -> None:
     # When
     heading_id = 313  # Line number of heading "How to count the number of words in a text file using bash?" in bash.md
     command = knowledge_provider.get_commands_from_record_tagged_as_command("bash", heading_id)
@@ -164,11 +172,7 @@ def test_should_return_command_extracted_from_a_record_which_is_tagged_as_comman
     assert command == EXPECTED_COMMAND, f"Actual command : {command}"
 
 
-def test_should_return_commands_extracted_from_a_record_which_is_tagged_as_commands() -> None:
-    # Given
-    persistence = FilePersistenceAdapter(Path(f"{TESTS_DIR}/tests_data/dataset_example"))
-    knowledge_provider = KnowledgeProvider(persistence)
-
+def test_should_return_commands_extracted_from_a_record_which_is_tagged_as_commands(knowledge_provider) -> None:
     # When
     heading_id = 318  # Line number of heading "How to count the number of words in a text file using bash?" in bash.md
     commands = knowledge_provider.get_commands_from_record_tagged_as_command("bash", heading_id)
@@ -177,14 +181,26 @@ def test_should_return_commands_extracted_from_a_record_which_is_tagged_as_comma
     assert commands == EXPECTED_COMMANDS_1, f"Actual commands are : {commands}"
 
 
-def test_should_return_commands_extracted_from_a_long_record_which_is_tagged_as_commands() -> None:
-    # Given
-    persistence = FilePersistenceAdapter(Path(f"{TESTS_DIR}/tests_data/dataset_example"))
-    knowledge_provider = KnowledgeProvider(persistence)
-
+def test_should_return_commands_extracted_from_a_long_record_which_is_tagged_as_commands(knowledge_provider) -> None:
     # When
     heading_id = 276  # Line number of heading "How to flash an ISO with `dd` in bash?"
     commands = knowledge_provider.get_commands_from_record_tagged_as_command("bash", heading_id)
 
     # Then
     assert commands == EXPECTED_COMMANDS_2, f"Actual commands are : {commands}"
+
+
+def test_should_return_up_to_date_headings_when_topic_file_is_edited(tmp_path) -> None:
+    # Given
+    topic_file = Path(tmp_path, "notes.md")
+    topic_file.write_text("# How to list files?\n\n```bash\nls\n```\n", encoding="utf-8")
+    knowledge_provider = KnowledgeProvider(FilePersistenceAdapter(tmp_path))
+    assert len(knowledge_provider.get_available_records_headings_for_topic("notes")) == 1
+
+    # When
+    with open(topic_file, "a", encoding="utf-8") as f:
+        f.write("\n# How to list hidden files?\n\n```bash\nls -a\n```\n")
+    heading_list = knowledge_provider.get_available_records_headings_for_topic("notes")
+
+    # Then
+    assert tuple(heading.text for heading in heading_list) == ("How to list files?", "How to list hidden files?")
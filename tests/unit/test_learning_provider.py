@@ -15,7 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from datetime import datetime, timedelta
+import logging
+import sqlite3
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -24,8 +26,13 @@ from freezegun import freeze_time
 from src.config import MAX_RECORDS_PER_REVIEW_GROUP
 from src.domain.learning.learning_provider import LearningProvider
 from src.infra.knowledge.file.file_persistence_adapter import FilePersistenceAdapter
-from src.infra.learning.sqlite_persistence_adapter import SQLitePersistenceAdapter
+from src.infra.learning.sqlite_persistence_adapter import IN_MEMORY_DB_PATH, SQLitePersistenceAdapter
 from tests.expected_results.test_learning_provider_expected_results import (
+    DATE_2025_02_22,
+    DATE_2025_02_27,
+    DATE_2025_03_11,
+    DATE_2025_03_12,
+    DATE_2025_03_22,
     EXPECTED_AD_REVIEW_GROUPS,
     EXPECTED_BASH_REVIEW_GROUPS,
     EXPECTED_KNOWLEDGE_RECORD_BASH_210,
@@ -41,93 +48,162 @@ from tests.unit.helper import (
     remove_review_db_from_dataset,
 )
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="session")
+def dataset_persistence() -> FilePersistenceAdapter:
+    """
+    File persistence on the example dataset, which is never modified by tests
+    """
+    return FilePersistenceAdapter(DATASET_PATH)
+
+
+@pytest.fixture(scope="session")
 def setup_and_teardown_sql_db():
-    print("\n[SETUP] Initializing resources...")
-    remove_mocked_review_db()
+    """
+    Mocked review database created once for the session, tests access it
+    through review_db_txn which rolls back their changes
+    """
+    logger.debug("[SETUP] Initializing resources...")
     create_mocked_review_db()
+    connection = sqlite3.connect(MOCKED_REVIEW_DB_PATH)
 
-    yield  # Executing tests
+    yield connection  # Executing tests
 
-    print("\n[TEARDOWN] Cleaning up resources...")
+    logger.debug("[TEARDOWN] Cleaning up resources...")
+    connection.close()
     remove_mocked_review_db()
 
 
+@pytest.fixture(scope="function")
+def review_db_txn(setup_and_teardown_sql_db):
+    """
+    Learning persistence on the mocked review database, all changes made by
+    the test are rolled back at the end of the test
+    """
+    with SQLitePersistenceAdapter(MOCKED_REVIEW_DB_PATH, setup_and_teardown_sql_db) as learning_persistence:
+        with learning_persistence.batch(rollback=True):
+            yield learning_persistence
+
+
 @pytest.fixture(scope="function")
 def teardown_dataset_db():
-    print("\n[SETUP] Initializing resources...")
-    remove_review_db_from_dataset()
+    # Nothing to set up: the database is created by the test and removed on teardown
     yield  # Executing tests
 
-    print("\n[TEARDOWN] Cleaning up resources...")
+    logger.debug("[TEARDOWN] Cleaning up resources...")
     remove_review_db_from_dataset()
 
 
-def test_fetch_review_groups_for_topic_Should_initialize_and_return_topic_review_groups(teardown_dataset_db) -> None:
+@pytest.fixture(scope="module")
+def shared_adapter():
+    """
+    Learning persistence on a review database living in memory, opened once for
+    all tests of the module
+    """
+    with SQLitePersistenceAdapter(IN_MEMORY_DB_PATH) as learning_persistence:
+        yield learning_persistence
+
+
+@pytest.fixture(scope="function")
+def in_memory_learning_persistence(shared_adapter):
+    """
+    Empty review database living in memory, all changes made by the test are
+    rolled back at the end of the test
+    """
+    with shared_adapter.batch(rollback=True):
+        yield shared_adapter
+
+
+@pytest.fixture(scope="session")
+def bash_review_db(dataset_persistence):
+    """
+    Review database living in memory, in which bash review groups are
+    initialized once for the session
+    """
+    with SQLitePersistenceAdapter(IN_MEMORY_DB_PATH) as learning_persistence:
+        LearningProvider(dataset_persistence, learning_persistence).fetch_review_groups_for_topic("bash")
+        yield learning_persistence
+
+
+@pytest.fixture(scope="function")
+def bash_learning_persistence(bash_review_db):
+    """
+    Review database with bash review groups, all changes made by the test are
+    rolled back at the end of the test
+    """
+    with bash_review_db.batch(rollback=True):
+        yield bash_review_db
+
+
+def test_fetch_review_groups_for_topic_Should_initialize_and_return_topic_review_groups(
+    dataset_persistence,
+    in_memory_learning_persistence,
+) -> None:
     # Given
-    persistence = FilePersistenceAdapter(DATASET_PATH)
-    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+    learning_provider = LearningProvider(dataset_persistence, in_memory_learning_persistence)
 
-        # When
-        review_groups = learning_provider.fetch_review_groups_for_topic("bash")
+    # When
+    review_groups = learning_provider.fetch_review_groups_for_topic("bash")
 
-        # Then
-        assert len(review_groups) == 4, f"Actual len of review groups : {len(review_groups)}"
-        assert review_groups == EXPECTED_BASH_REVIEW_GROUPS, f"Actual content of review groups : {review_groups}"
+    # Then
+    assert len(review_groups) == 4, f"Actual len of review groups : {len(review_groups)}"
+    assert review_groups == EXPECTED_BASH_REVIEW_GROUPS, f"Actual content of review groups : {review_groups}"
 
 
-def test_get_next_record_to_review_Should_return_next_record_to_review(teardown_dataset_db) -> None:
+def test_get_next_record_to_review_Should_return_next_record_to_review(
+    dataset_persistence,
+    in_memory_learning_persistence,
+) -> None:
     # Given
-    persistence = FilePersistenceAdapter(DATASET_PATH)
-    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+    learning_provider = LearningProvider(dataset_persistence, in_memory_learning_persistence)
 
-        # When
-        # Select the review group with id 3 (is a bash review group)
-        learning_provider.fetch_groups_to_review()
-        learning_provider.init_review_session(review_group_id=4)
-        next_record_to_review = learning_provider.get_next_record_to_review()
+    # When
+    # Select the review group with id 3 (is a bash review group)
+    learning_provider.fetch_groups_to_review()
+    learning_provider.init_review_session(review_group_id=4)
+    next_record_to_review = learning_provider.get_next_record_to_review()
 
-        # Then
-        assert next_record_to_review == EXPECTED_KNOWLEDGE_RECORD_BASH_210, (
-            f"Actual content of next record to review : {next_record_to_review}"
-        )
+    # Then
+    assert next_record_to_review == EXPECTED_KNOWLEDGE_RECORD_BASH_210, (
+        f"Actual content of next record to review : {next_record_to_review}"
+    )
 
-        # When
-        next_record_to_review = learning_provider.get_next_record_to_review()
+    # When
+    next_record_to_review = learning_provider.get_next_record_to_review()
 
-        # Then
-        assert next_record_to_review == EXPECTED_KNOWLEDGE_RECORD_BASH_230, (
-            f"Actual content of next record to review : {next_record_to_review}"
-        )
+    # Then
+    assert next_record_to_review == EXPECTED_KNOWLEDGE_RECORD_BASH_230, (
+        f"Actual content of next record to review : {next_record_to_review}"
+    )
 
 
 @freeze_time("2025-03-03")
 def test_fetch_groups_to_review_Should_return_all_groups_to_review_ordered_by_nearest_next_review_date(
-    setup_and_teardown_sql_db,
+    review_db_txn,
 ) -> None:
-    print(datetime.now())
+    logger.debug("Frozen date : %s", datetime.now())
     # Given
     persistence = FilePersistenceAdapter(Path("/dev/null"))
-    with SQLitePersistenceAdapter(MOCKED_REVIEW_DB_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+    learning_provider = LearningProvider(persistence, review_db_txn)
 
-        # When
-        next_groups_to_review = learning_provider.fetch_groups_to_review()
+    # When
+    next_groups_to_review = learning_provider.fetch_groups_to_review()
 
-        # Then
-        assert next_groups_to_review == EXPECTED_ORDERED_GROUPS_TO_REVIEW, (
-            f"Actual content of next groups to review : {next_groups_to_review}"
-        )
+    # Then
+    assert next_groups_to_review == EXPECTED_ORDERED_GROUPS_TO_REVIEW, (
+        f"Actual content of next groups to review : {next_groups_to_review}"
+    )
 
 
 @freeze_time("2025-03-11")
-def test_dates_and_count_Should_be_updated_When_all_group_items_have_been_reviewd(teardown_dataset_db) -> None:
-    persistence = FilePersistenceAdapter(DATASET_PATH)
+def test_dates_and_count_Should_be_updated_When_all_group_items_have_been_reviewd(
+    dataset_persistence,
+    teardown_dataset_db,
+) -> None:
     with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+        learning_provider = LearningProvider(dataset_persistence, learning_persistence)
 
         learning_provider.fetch_review_groups_for_topic("bash")
         learning_provider.init_review_session(review_group_id=3)
@@ -140,8 +216,7 @@ def test_dates_and_count_Should_be_updated_When_all_group_items_have_been_review
             and group_to_review.reviews_count == 0
         )
 
-        for _ in range(0, MAX_RECORDS_PER_REVIEW_GROUP - 1):
-            learning_provider.get_next_record_to_review()
+        learning_provider.advance_review_session(MAX_RECORDS_PER_REVIEW_GROUP - 1)
 
         # Check nothing change until last group record has been reviewed
         assert (
@@ -155,119 +230,128 @@ def test_dates_and_count_Should_be_updated_When_all_group_items_have_been_review
 
         # Check review group dates and count is updated after review of last group record
         assert (
-            group_to_review.last_review_date == datetime(2025, 3, 11)
-            and group_to_review.next_review_date == datetime(2025, 3, 12)
+            group_to_review.last_review_date == DATE_2025_03_11
+            and group_to_review.next_review_date == DATE_2025_03_12
             and group_to_review.reviews_count == 1
         )
 
         # Check nothing change when a new review on the same group happens on the same day
         # even if learning provider is restarted
-    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
-        learning_provider.fetch_review_groups_for_topic("bash")
+        learning_persistence.reopen()
+        learning_provider = LearningProvider(dataset_persistence, learning_persistence)
         learning_provider.init_review_session(review_group_id=3)
         group_to_review = learning_provider.current_review_group
-        for _ in range(0, MAX_RECORDS_PER_REVIEW_GROUP):
-            learning_provider.get_next_record_to_review()
+        learning_provider.advance_review_session(MAX_RECORDS_PER_REVIEW_GROUP)
 
         assert (
-            group_to_review.last_review_date == datetime(2025, 3, 11)
-            and group_to_review.next_review_date == datetime(2025, 3, 12)
+            group_to_review.last_review_date == DATE_2025_03_11
+            and group_to_review.next_review_date == DATE_2025_03_12
             and group_to_review.reviews_count == 1
         )
 
 
-def test_siblings_headers_should_not_be_considered_as_different_record_to_review(teardown_dataset_db) -> None:
+def test_siblings_headers_should_not_be_considered_as_different_record_to_review(
+    dataset_persistence,
+    in_memory_learning_persistence,
+) -> None:
     # Given
-    persistence = FilePersistenceAdapter(DATASET_PATH)
-    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+    learning_provider = LearningProvider(dataset_persistence, in_memory_learning_persistence)
 
-        review_groups = learning_provider.fetch_review_groups_for_topic("ad")
-        assert review_groups == EXPECTED_AD_REVIEW_GROUPS
+    review_groups = learning_provider.fetch_review_groups_for_topic("ad")
+    assert review_groups == EXPECTED_AD_REVIEW_GROUPS
 
 
+@pytest.mark.parametrize("review_group_id", [1, 2, 3, 4])
 def test_reviewing_group_with_less_than_max_records_per_review_group_Should_loop_the_correct_number_of_records(
-    teardown_dataset_db,
+    dataset_persistence,
+    bash_learning_persistence,
+    review_group_id,
 ) -> None:
     # Given
-    persistence = FilePersistenceAdapter(DATASET_PATH)
-    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+    learning_provider = LearningProvider(dataset_persistence, bash_learning_persistence)
 
-        learning_provider.fetch_review_groups_for_topic("bash")
-        for index in range(1, 5):
-            learning_provider.init_review_session(review_group_id=index)
-            first_review_group_record = learning_provider.get_next_record_to_review()
-            for _ in range(learning_provider.get_number_of_records_in_review_group() - 1):
-                learning_provider.get_next_record_to_review()
-            next_loop_first_review_group_record = learning_provider.get_next_record_to_review()
-            assert first_review_group_record == next_loop_first_review_group_record
+    # When
+    learning_provider.init_review_session(review_group_id=review_group_id)
+    first_review_group_record = learning_provider.get_next_record_to_review()
+    learning_provider.advance_review_session(learning_provider.get_number_of_records_in_review_group() - 1)
+    next_loop_first_review_group_record = learning_provider.get_next_record_to_review()
 
+    # Then
+    assert first_review_group_record == next_loop_first_review_group_record
 
+
+@pytest.mark.parametrize(
+    "review_date, reviews_count, next_review_date, expected_next_review_date",
+    [
+        ("2025-02-22", 1, DATE_2025_02_22, DATE_2025_02_27),
+        ("2025-02-27", 2, DATE_2025_02_27, DATE_2025_03_22),
+        ("2025-03-23", 3, DATE_2025_03_22, None),
+    ],
+)
 def test_Once_all_records_have_been_reviewed_next_review_date_and_review_count_Should_be_updated(
-    setup_and_teardown_sql_db,
+    dataset_persistence,
+    review_db_txn,
+    review_date,
+    reviews_count,
+    next_review_date,
+    expected_next_review_date,
 ) -> None:
     # Given
-    persistence = FilePersistenceAdapter(Path(DATASET_PATH))
-    with SQLitePersistenceAdapter(MOCKED_REVIEW_DB_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
-
-        # When
-        with freeze_time("2025-02-22"):
-            learning_provider.fetch_review_groups_for_topic("bash")
-            learning_provider.init_review_session(review_group_id=5)
-            # Check initial state
-            assert learning_provider.current_review_group.reviews_count == 1
-            if (next_review_date := learning_provider.current_review_group.next_review_date) is not None:
-                assert next_review_date.date() == datetime.today().date()
-            for _ in range(learning_provider.get_number_of_records_in_review_group()):
-                learning_provider.get_next_record_to_review()
-
-            assert learning_provider.current_review_group.reviews_count == 2
-            if (next_review_date := learning_provider.current_review_group.next_review_date) is not None:
-                assert next_review_date.date() == (datetime.today() + timedelta(days=5)).date()
-
-        # When
-        with freeze_time("2025-02-27"):
-            learning_provider.fetch_review_groups_for_topic("bash")
-            learning_provider.init_review_session(review_group_id=5)
-            # Check initial state
-            assert learning_provider.current_review_group.reviews_count == 2
-            if (next_review_date := learning_provider.current_review_group.next_review_date) is not None:
-                assert next_review_date.date() == datetime.today().date()
-            for _ in range(learning_provider.get_number_of_records_in_review_group()):
-                learning_provider.get_next_record_to_review()
-
-            assert learning_provider.current_review_group.reviews_count == 3
-            if (next_review_date := learning_provider.current_review_group.next_review_date) is not None:
-                assert next_review_date.date() == (datetime.today() + timedelta(days=23)).date()
+    learning_provider = LearningProvider(dataset_persistence, review_db_txn)
+    learning_provider.fetch_review_groups_for_topic("bash")
+    review_group = review_db_txn.get_review_group_by_id(5)
+    review_group.reviews_count = reviews_count
+    review_group.next_review_date = next_review_date
+    review_db_txn.update_review_group_dates_and_count(review_group)
+
+    # When
+    with freeze_time(review_date):
+        learning_provider.init_review_session(review_group_id=5)
+        learning_provider.advance_review_session(learning_provider.get_number_of_records_in_review_group())
+
+    # Then
+    assert learning_provider.current_review_group.reviews_count == reviews_count + 1
+    assert learning_provider.current_review_group.next_review_date == expected_next_review_date, (
+        f"Actual next review date : {learning_provider.current_review_group.next_review_date}"
+    )
+
+
+def test_number_of_records_of_last_review_group_Should_be_one_for_a_one_record_topic(
+    dataset_persistence,
+    in_memory_learning_persistence,
+) -> None:
+    # Given
+    learning_provider = LearningProvider(dataset_persistence, in_memory_learning_persistence)
 
-        # When
-        with freeze_time("2025-03-23"):
-            learning_provider.fetch_review_groups_for_topic("bash")
-            learning_provider.init_review_session(review_group_id=5)
-            # Check initial state
-            assert learning_provider.current_review_group.reviews_count == 3
-            if (next_review_date := learning_provider.current_review_group.next_review_date) is not None:
-                assert next_review_date.date() == (datetime.today() + timedelta(days=-1)).date()
-            for _ in range(learning_provider.get_number_of_records_in_review_group()):
-                learning_provider.get_next_record_to_review()
+    # When
+    learning_provider.fetch_review_groups_for_topic("curl")
+    learning_provider.init_review_session(review_group_id=1)
+    records_nbr = learning_provider.get_number_of_records_in_review_group()
 
-            assert learning_provider.current_review_group.reviews_count == 4
-            assert learning_provider.current_review_group.next_review_date is None
+    # Then
+    assert records_nbr == 1, f"Actual records number is : {records_nbr}"
 
 
-def test_number_of_records_of_last_review_group_Should_be_one_for_a_one_record_topic(teardown_dataset_db) -> None:
+def test_review_groups_updates_made_in_a_failing_batch_Should_be_rolled_back(teardown_dataset_db) -> None:
     # Given
-    persistence = FilePersistenceAdapter(DATASET_PATH)
     with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
-        learning_provider = LearningProvider(persistence, learning_persistence)
+        learning_persistence.update_review_groups_for_topic("ad", 1)
 
         # When
-        learning_provider.fetch_review_groups_for_topic("curl")
-        learning_provider.init_review_session(review_group_id=1)
-        records_nbr = learning_provider.get_number_of_records_in_review_group()
+        with pytest.raises(RuntimeError):
+            with learning_persistence.batch():
+                learning_persistence.update_review_groups_for_topic("bash", 28)
+                raise RuntimeError("Review session interrupted")
 
         # Then
-        assert records_nbr == 1, f"Actual records number is : {records_nbr}"
+        assert learning_persistence.get_number_of_review_groups_for_topic("ad") == 1
+        assert learning_persistence.get_number_of_review_groups_for_topic("bash") == 0
+
+    # When
+    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
+        with learning_persistence.batch():
+            learning_persistence.update_review_groups_for_topic("bash", 28)
+
+    # Then
+    with SQLitePersistenceAdapter(REVIEW_DB_FROM_DATASET_PATH) as learning_persistence:
+        assert learning_persistence.get_number_of_review_groups_for_topic("bash") == 4
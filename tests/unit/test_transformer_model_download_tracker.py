@@ -15,15 +15,83 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import time
 from pathlib import Path
 
+import pytest
+
 from src.infra.knowledge.sentence_similarity.transformer_model_download_tracker import TransformerModelDownloadTracker
 
 TESTS_DIR: Path = Path(__file__).resolve().parent.parent
 MODEL_DL_PATH = Path(TESTS_DIR, "tests_data", "mock_model_dl")
 
 
-def test_percent_after_resume():
+@pytest.fixture(scope="session")
+def model_dl_tracker():
+    """
+    Tracker resumed once from the mocked download log, stopped at the end of the session
+    """
     model_dl_watcher = TransformerModelDownloadTracker(MODEL_DL_PATH)
     model_dl_watcher.resume()
-    assert model_dl_watcher.download_status() == 14
+    yield model_dl_watcher
+    model_dl_watcher.stop()
+
+
+def test_percent_after_resume(model_dl_tracker):
+    assert model_dl_tracker.download_status() == 14
+
+
+def test_percent_is_updated_when_new_lines_are_appended_to_log_file(tmp_path):
+    model_dl_file = Path(tmp_path, "model_dl")
+    model_dl_file.touch()
+    model_dl_watcher = TransformerModelDownloadTracker(model_dl_file)
+    assert model_dl_watcher.is_running()
+
+    # The watcher only follows lines written after it has opened the file, so
+    # keep appending progress lines until one of them has been caught
+    deadline = time.monotonic() + 5
+    with open(model_dl_file, "a", encoding="utf-8") as f:
+        while model_dl_watcher.download_status() != 42 and time.monotonic() < deadline:
+            f.write("model.safetensors:  42% 466M/1.11G [00:14<02:53, 5.49MB/s]\n")
+            f.flush()
+            time.sleep(0.05)
+    model_dl_watcher.stop()
+
+    assert model_dl_watcher.download_status() == 42
+    assert not model_dl_watcher.is_running()
+
+
+def test_log_file_is_followed_once_created(tmp_path):
+    model_dl_file = Path(tmp_path, "model_dl")
+    model_dl_watcher = TransformerModelDownloadTracker(model_dl_file)
+
+    # The watcher opens the file when it is created, then follows lines written after that
+    deadline = time.monotonic() + 5
+    with open(model_dl_file, "a", encoding="utf-8") as f:
+        while model_dl_watcher.download_status() != 42 and time.monotonic() < deadline:
+            f.write("model.safetensors:  42% 466M/1.11G [00:14<02:53, 5.49MB/s]\n")
+            f.flush()
+            time.sleep(0.05)
+    model_dl_watcher.stop()
+
+    assert model_dl_watcher.download_status() == 42
+    assert not model_dl_watcher.is_running()
+
+
+def test_download_is_complete_only_when_all_tracked_files_are_fully_downloaded(tmp_path):
+    model_dl_file = Path(tmp_path, "model_dl")
+    tracked_files = TransformerModelDownloadTracker.tracked_files
+    lines = [f"{filename}: 100% 10.0/10.0 [00:00<00:00, 1.00MB/s]\n" for filename in tracked_files]
+    lines.append("model.safetensors:  99% 1.10G/1.11G [03:00<00:01, 5.49MB/s]\n")
+    model_dl_file.write_text("".join(lines), encoding="utf-8")
+    model_dl_watcher = TransformerModelDownloadTracker(model_dl_file)
+    model_dl_watcher.resume()
+    model_dl_watcher.stop()
+
+    assert not model_dl_watcher.is_download_complete()
+
+    with open(model_dl_file, "a", encoding="utf-8") as f:
+        f.write("model.safetensors: 100% 1.11G/1.11G [03:01<00:00, 5.49MB/s]\n")
+    model_dl_watcher.resume()
+
+    assert model_dl_watcher.is_download_complete()